@@ -181,12 +181,17 @@ def register_op_attr(op_name, attr_key, value=None, level=10):
         Register function if value is not specified.
     """
 
+    # direct registration doesn't need the decorator closure
+    if value is not None:
+        _ffi_api.RegisterOpAttr(op_name, attr_key, value, level)
+        return value
+
     def _register(v):
         """internal register function"""
         _ffi_api.RegisterOpAttr(op_name, attr_key, v, level)
         return v
 
-    return _register(value) if value is not None else _register
+    return _register
 
 
 def register_intrin_lowering(
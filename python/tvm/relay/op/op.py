@@ -42,6 +42,31 @@ def get(op_name):
     return tvm.ir.Op.get(op_name)
 
 
+_GET_OP_CACHE = {}
+
+
+def _cached_get(op_name):
+    """get() with memoization, for registration helpers that repeatedly resolve the
+    same operator. Op handles are stable once registered, so caching them only skips
+    the FFI roundtrip into the registry.
+
+    Parameters
+    ----------
+    op_name : str
+        The operator name
+
+    Returns
+    -------
+    op : Op
+        The op of the corresponding name
+    """
+    op = _GET_OP_CACHE.get(op_name)
+    if op is None:
+        op = get(op_name)
+        _GET_OP_CACHE[op_name] = op
+    return op
+
+
 def register(op_name, describe=""):
     """Get the Op for a given name.
     when the op_name is not registered, create a new empty op with the given name.
@@ -191,7 +216,7 @@ def _wrap_default_fstrategy(compute, schedule, name):
 
 def _create_fstrategy_from_schedule(op_name, schedule):
     assert hasattr(schedule, "dispatch_dict")
-    compute = get(op_name).get_attr("FTVMCompute")
+    compute = _cached_get(op_name).get_attr("FTVMCompute")
     assert compute is not None, "FTVMCompute is not registered for op %s" % op_name
     fstrategy = get_native_generic_func("{}_strategy".format(op_name))
     name_pfx = schedule.__name__
@@ -265,22 +290,28 @@ def register_schedule(op_name, schedule, level=10):
     return register_strategy(op_name, fstrategy, level)
 
 
-def register_injective_schedule(op_name, level=10):
-    """Register injective schedule function for an op.
+def _make_schedule_registrar(kind, schedule_name):
+    """Create a register_<kind>_schedule function backed by a shared generic schedule.
+
+    The schedule generic is resolved by name at registration time because
+    _schedule_injective and _schedule_reduce are populated after this module
+    is imported.
 
     Parameters
     ----------
-    op_name : str
-        The name of the op.
+    kind : str
+        The schedule kind, used to name the registrar.
 
-    level : int
-        The priority level
+    schedule_name : str
+        The name of the module-level schedule generic to register.
     """
-    return register_schedule(op_name, _schedule_injective, level)
 
+    def _register(op_name, level=10):
+        return register_schedule(op_name, globals()[schedule_name], level)
 
-def register_broadcast_schedule(op_name, level=10):
-    """Register broadcast schedule function for an op.
+    _register.__name__ = "register_{}_schedule".format(kind)
+    _register.__qualname__ = _register.__name__
+    _register.__doc__ = """Register {} schedule function for an op.
 
     Parameters
     ----------
@@ -289,22 +320,15 @@ def register_broadcast_schedule(op_name, level=10):
 
     level : int
         The priority level
-    """
-    return register_schedule(op_name, _schedule_injective, level)
-
+    """.format(
+        kind
+    )
+    return _register
 
-def register_reduce_schedule(op_name, level=10):
-    """Register reduce schedule function for an op.
 
-    Parameters
-    ----------
-    op_name : str
-        The name of the op.
-
-    level : int
-        The priority level
-    """
-    return register_schedule(op_name, _schedule_reduce, level)
+register_injective_schedule = _make_schedule_registrar("injective", "_schedule_injective")
+register_broadcast_schedule = _make_schedule_registrar("broadcast", "_schedule_injective")
+register_reduce_schedule = _make_schedule_registrar("reduce", "_schedule_reduce")
 
 
 def register_alter_op_layout(op_name, alter_layout=None, level=10):
@@ -431,7 +455,7 @@ def register_shape_func(op_name, data_dependent, shape_func=None, level=10):
     """
     if not isinstance(data_dependent, list):
         data_dependent = [data_dependent]
-    get(op_name).set_attr("TShapeDataDependent", data_dependent, level)
+    _cached_get(op_name).set_attr("TShapeDataDependent", data_dependent, level)
     return tvm.ir.register_op_attr(op_name, "FShapeFunc", shape_func, level)
 
 
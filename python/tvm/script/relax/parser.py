@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import inspect
+import sys
 from typing import Union, Dict, List, Tuple, Optional, Callable, Any
 from enum import Enum
 
@@ -81,13 +82,24 @@ class ArithmeticOp(Enum):
     FLOOR_DIV = ast.BuiltinOp.FloorDiv
 
 
-RELAX_ARITHMETIC_OP_MAP = {
-    ArithmeticOp.ADD: relay.op.get("add"),
-    ArithmeticOp.SUB: relay.op.get("subtract"),
-    ArithmeticOp.MUL: relay.op.get("multiply"),
-    ArithmeticOp.DIV: relay.op.get("divide"),
-    ArithmeticOp.FLOOR_DIV: relay.op.get("floor_divide"),
-}
+# maps ArithmeticOp to the corresponding relay op; populated lazily on first use so
+# that importing the parser doesn't pay the operator-registry roundtrips up front
+RELAX_ARITHMETIC_OP_MAP = {}
+
+
+def _relax_arithmetic_op_map():
+    if not RELAX_ARITHMETIC_OP_MAP:
+        RELAX_ARITHMETIC_OP_MAP.update(
+            {
+                ArithmeticOp.ADD: relay.op.get("add"),
+                ArithmeticOp.SUB: relay.op.get("subtract"),
+                ArithmeticOp.MUL: relay.op.get("multiply"),
+                ArithmeticOp.DIV: relay.op.get("divide"),
+                ArithmeticOp.FLOOR_DIV: relay.op.get("floor_divide"),
+            }
+        )
+    return RELAX_ARITHMETIC_OP_MAP
+
 
 PRIMEXPR_ARITHMETIC_OP_MAP = {
     ArithmeticOp.ADD: tir.Add,
@@ -97,6 +109,31 @@ PRIMEXPR_ARITHMETIC_OP_MAP = {
     ArithmeticOp.FLOOR_DIV: tir.FloorDiv,
 }
 
+# hot string literals compared against synr identifiers on every type annotation and
+# attribute access; interned so the comparisons usually short-circuit on identity
+_TENSOR = sys.intern("Tensor")
+_TUPLE = sys.intern("Tuple")
+_SHAPE_TYPE = sys.intern("Shape")
+_DIM_TYPE = sys.intern("Dim")
+_SHAPE_ATTR = sys.intern("shape")
+_ERASED = sys.intern("_")
+
+
+class _Scope:
+    """Context manager that pushes a copy of the current scope on entry and pops it on exit."""
+
+    __slots__ = ("transformer",)
+
+    def __init__(self, transformer: "RelaxTransformer"):
+        self.transformer = transformer
+
+    def __enter__(self):
+        self.transformer._scopes.append(self.transformer._scopes[-1].copy())
+
+    def __exit__(self, *exc):
+        assert len(self.transformer._scopes) > 1, "cannot pop root scope"
+        self.transformer._scopes.pop()
+
 
 class RelaxTransformer(Transformer):
     def __init__(self, ir_mod: IRModule, relax_prefix: List[str], tir_prefix: List[str]):
@@ -106,6 +143,26 @@ class RelaxTransformer(Transformer):
         self.tir_prefix = tir_prefix
         self._scopes = [{}]  # str -> Var
         self._registered_ops = set(tvm.ir._ffi_api.ListOpNames())  # cached
+        self._op_cache = {}  # str -> Op/SpecialOp; memoized operator resolution
+        # dispatch tables keyed on the exact synr node type, so that the hot
+        # transform_expr/transform_stmt entry points are a single dict lookup
+        # instead of a linear isinstance scan
+        self._expr_dispatch = {
+            ast.Attr: self.parse_attr,
+            ast.Call: self.parse_call,
+            ast.Tuple: self.parse_tuple,
+            ast.Var: self.parse_var,
+            ast.Constant: self.parse_constant,
+            ast.Op: self.parse_op,
+        }
+        self._stmt_dispatch = {
+            ast.Assign: self.parse_binding,
+            ast.If: self.parse_if,
+            ast.Return: self.parse_return,
+            ast.UnassignedCall: self.parse_unassigned_call,
+            ast.With: self.parse_with,
+            ast.Function: self.parse_local_function,
+        }
 
     def to_tvm_span(self, span: ast.Span) -> tvm.ir.Span:
         """Helper method for converting synr span to TVM span.
@@ -143,18 +200,6 @@ class RelaxTransformer(Transformer):
         _Scope
             An internal scope context object used in a with block to create a new scope
         """
-
-        class _Scope:
-            def __init__(self, transformer: "RelaxTransformer"):
-                self.transformer = transformer
-
-            def __enter__(self):
-                self.transformer._scopes.append(self.transformer._scopes[-1].copy())
-
-            def __exit__(self, *exc):
-                assert len(self.transformer._scopes) > 1, "cannot pop root scope"
-                self.transformer._scopes.pop()
-
         return _Scope(self)
 
     @property
@@ -194,6 +239,9 @@ class RelaxTransformer(Transformer):
         Union[relax.Var, relax.DataflowVar]
             The declared variable
         """
+        # interning the name makes the scope dict lookups below (and in parse_var/parse_primexpr)
+        # a pointer comparison instead of a full string comparison
+        name = sys.intern(name)
         if name in self.scope:
             # TODO(@altanh): maybe emit an error at the declaration site and report it together
             self.report_error("variable has already been declared in the current scope", span)
@@ -226,18 +274,18 @@ class RelaxTransformer(Transformer):
 
         # simple annotation with no type arguments
         if isinstance(ty, ast.TypeVar):
-            if ty.id.name == "Tensor":
+            if ty.id.name == _TENSOR:
                 return (relax.DynTensorType(rank=-1, dtype=None, span=span), None)
-            elif ty.id.name == "Shape":
+            elif ty.id.name == _SHAPE_TYPE:
                 return (relax.ShapeType(span), None)
-            elif ty.id.name == "Dim":
+            elif ty.id.name == _DIM_TYPE:
                 return (relax.DimType(span), None)
             else:
                 self.report_error("unknown type in annotation", span)
 
         # annotation with type arguments/shape annotation
         if isinstance(ty, ast.TypeApply):
-            if ty.id.name == "Tensor":
+            if ty.id.name == _TENSOR:
                 # TODO(@altanh): forgetting dtype like "Tensor[(n, m)]" ends up getting parsed as
                 #                Tensor[n, m] which makes correct errors difficult here...
                 if len(ty.params) != 2:
@@ -251,7 +299,7 @@ class RelaxTransformer(Transformer):
 
                 # parse the shape annotation
                 if isinstance(shape_annotation, ast.TypeVar):
-                    if shape_annotation.id.name != "_":
+                    if shape_annotation.id.name != _ERASED:
                         # TODO(@altanh): handle variable annotations, e.g. x: Tensor[my_shape, _]
                         self.report_error(
                             "variable Tensor shape annotations not yet supported",
@@ -265,7 +313,7 @@ class RelaxTransformer(Transformer):
                     # k, where each element is "_" (e.g. "(_, _)" for rank 2)
                     is_unmatched = all(
                         map(
-                            lambda v: isinstance(v, ast.Var) and v.id.name == "_",
+                            lambda v: isinstance(v, ast.Var) and v.id.name == _ERASED,
                             shape_annotation.values,
                         )
                     )
@@ -284,7 +332,10 @@ class RelaxTransformer(Transformer):
                     )
 
                 # parse the dtype annotation
-                if isinstance(dtype_annotation, ast.TypeVar) and dtype_annotation.id.name == "_":
+                if (
+                    isinstance(dtype_annotation, ast.TypeVar)
+                    and dtype_annotation.id.name == _ERASED
+                ):
                     pass  # dtype = None
                 elif isinstance(dtype_annotation, ast.TypeConstant):
                     dtype = dtype_annotation.value
@@ -295,7 +346,7 @@ class RelaxTransformer(Transformer):
                     )
 
                 return (relax.DynTensorType(rank=rank, dtype=dtype, span=span), shape)
-            elif ty.id.name == "Tuple":
+            elif ty.id.name == _TUPLE:
                 field_types = []
                 field_shapes = []
                 for field in ty.params:
@@ -343,7 +394,7 @@ class RelaxTransformer(Transformer):
             The result PrimExpr
         """
         if isinstance(expr, ast.Var):
-            var_name = expr.id.name
+            var_name = sys.intern(expr.id.name)
             if var_name in self.scope:
                 var = self.scope[var_name]
                 if not isinstance(var, tir.Var):
@@ -368,7 +419,9 @@ class RelaxTransformer(Transformer):
         elif isinstance(expr, ast.Constant):
             if not isinstance(expr.value, int):
                 self.report_error("only integer constants are supported", expr.span)
-            return tir.const(expr.value, "int64", self.to_tvm_span(expr.span))
+            # constructed directly as an IntImm (like parse_constant) to skip the generic
+            # dtype dispatch in tir.const, which runs once per dimension literal
+            return tir.IntImm("int64", expr.value, self.to_tvm_span(expr.span))
 
         elif isinstance(expr, ast.Call):
             if not isinstance(expr.func_name, ast.Op):
@@ -407,12 +460,13 @@ class RelaxTransformer(Transformer):
         if isinstance(root_func, ast.Function):
             return self.transform_function(root_func, is_global=True)
         elif isinstance(root_func, ast.Class):
+            funcs = root_func.funcs
+            scope = self.scope
             # add global vars to the root scope for resolving global function calls
-            for func_name in root_func.funcs:
-                self.scope[func_name] = relay.GlobalVar(func_name)
-            for func_name, func in root_func.funcs.items():
-                global_var = self.scope[func_name]
-                self.module[global_var] = self.transform_function(func, is_global=True)
+            for func_name in funcs:
+                scope[func_name] = relay.GlobalVar(func_name)
+            for func_name, func in funcs.items():
+                self.module[scope[func_name]] = self.transform_function(func, is_global=True)
             return self.module
         else:
             self.report_error(f"unsupported input class: {root_func}", root_func.span)
@@ -643,108 +697,167 @@ class RelaxTransformer(Transformer):
         Union[relax.Expr, relax.Binding, relax.DataflowBlock]
             The parsed Relax node
         """
-        if isinstance(stmt, ast.Assign):
-            # dataflow bindings are handled separately in parse_dataflow
-            return self.parse_binding(stmt)
-
-        elif isinstance(stmt, ast.If):
-            # check branches are non-empty
-            if len(stmt.true.stmts) == 0 or len(stmt.false.stmts) == 0:
-                self.report_error("both branches of an if-else block must be non-empty", stmt.span)
-            true_assign = stmt.true.stmts[-1]
-            false_assign = stmt.false.stmts[-1]
-
-            # check last statement in each branch lines up
-            if not isinstance(true_assign, ast.Assign) or not isinstance(
-                self._get_lhs(true_assign), ast.Var
-            ):
-                self.report_error(
-                    "each branch of an if-else statement must end in a variable assignment",
-                    true_assign.span,
-                )
-            if not isinstance(false_assign, ast.Assign) or not isinstance(
-                self._get_lhs(false_assign), ast.Var
-            ):
-                self.report_error(
-                    "each branch of an if-else statement must end in a variable assignment",
-                    false_assign.span,
-                )
-            union_span = ast.Span.union([true_assign.span, false_assign.span])
-            if self._get_lhs(true_assign).id.name != self._get_lhs(false_assign).id.name:
-                self.report_error(
-                    "the final assignment of both branches must have the same variable",
-                    union_span,
-                )
+        # dataflow bindings (ast.Assign) are handled separately in parse_dataflow
+        parse = self._stmt_dispatch.get(type(stmt))
+        if parse is None:
+            self.report_error(
+                "unsupported statement",
+                stmt.span,
+            )
+        return parse(stmt)
 
-            var_name = self._get_lhs(true_assign).id.name
+    def parse_if(self, stmt: ast.If) -> relax.VarBinding:
+        """Parses the given synr if-else statement to a Relax binding of an if-else expression.
 
-            # rewrite branches to have a return statement so the blocks properly parse to SeqExprs
-            true_block = synr.ast.Block(
-                span=stmt.true.span,
-                stmts=stmt.true.stmts[:-1]
-                + [synr.ast.Return(span=true_assign.span, value=true_assign.rhs)],
+        Parameters
+        ----------
+        stmt : ast.If
+            The input synr if-else statement
+
+        Returns
+        -------
+        relax.VarBinding
+            The parsed binding of the if-else expression
+        """
+        # check branches are non-empty
+        if len(stmt.true.stmts) == 0 or len(stmt.false.stmts) == 0:
+            self.report_error("both branches of an if-else block must be non-empty", stmt.span)
+        true_assign = stmt.true.stmts[-1]
+        false_assign = stmt.false.stmts[-1]
+
+        # check last statement in each branch lines up
+        if not isinstance(true_assign, ast.Assign) or not isinstance(
+            self._get_lhs(true_assign), ast.Var
+        ):
+            self.report_error(
+                "each branch of an if-else statement must end in a variable assignment",
+                true_assign.span,
             )
-            false_block = synr.ast.Block(
-                span=stmt.false.span,
-                stmts=stmt.false.stmts[:-1]
-                + [synr.ast.Return(span=false_assign.span, value=false_assign.rhs)],
+        if not isinstance(false_assign, ast.Assign) or not isinstance(
+            self._get_lhs(false_assign), ast.Var
+        ):
+            self.report_error(
+                "each branch of an if-else statement must end in a variable assignment",
+                false_assign.span,
+            )
+        union_span = ast.Span.union([true_assign.span, false_assign.span])
+        if self._get_lhs(true_assign).id.name != self._get_lhs(false_assign).id.name:
+            self.report_error(
+                "the final assignment of both branches must have the same variable",
+                union_span,
             )
 
-            # parse the branches, build the final expression and binding
-            cond = self.transform_expr(stmt.condition)
-            with self.new_scope():
-                true_branch = self.transform_block(true_block)
-            with self.new_scope():
-                false_branch = self.transform_block(false_block)
-            # TODO(@altanh): the spans here are all sorts of messed up, not sure how to fix
-            ite_expr = relay.If(cond, true_branch, false_branch, self.to_tvm_span(stmt.span))
-            # TODO(@altanh): type and shape of return var
-            var = self.decl_var(var_name, None, None, union_span)
-            return relax.VarBinding(var, ite_expr, self.to_tvm_span(union_span))
-
-        elif isinstance(stmt, ast.Return):
-            return self.transform_expr(stmt.value)
-
-        elif isinstance(stmt, ast.UnassignedCall):
-            if self.transform_expr(stmt.call.func_name) == SpecialOp.MATCH_SHAPE:
-                return self.parse_shape_binding(stmt)
-            else:
-                self.report_error("the results of normal function calls must be bound", stmt.span)
+        var_name = self._get_lhs(true_assign).id.name
 
-        elif isinstance(stmt, ast.With):
-            if not isinstance(stmt.rhs, ast.Call):
-                self.report_error("unsupported with block", stmt.span)
+        # rewrite branches to have a return statement so the blocks properly parse to SeqExprs
+        true_block = synr.ast.Block(
+            span=stmt.true.span,
+            stmts=stmt.true.stmts[:-1]
+            + [synr.ast.Return(span=true_assign.span, value=true_assign.rhs)],
+        )
+        false_block = synr.ast.Block(
+            span=stmt.false.span,
+            stmts=stmt.false.stmts[:-1]
+            + [synr.ast.Return(span=false_assign.span, value=false_assign.rhs)],
+        )
 
-            call = stmt.rhs
-            op = self.transform_expr(call.func_name)
+        # parse the branches, build the final expression and binding
+        cond = self.transform_expr(stmt.condition)
+        with self.new_scope():
+            true_branch = self.transform_block(true_block)
+        with self.new_scope():
+            false_branch = self.transform_block(false_block)
+        # TODO(@altanh): the spans here are all sorts of messed up, not sure how to fix
+        ite_expr = relay.If(cond, true_branch, false_branch, self.to_tvm_span(stmt.span))
+        # TODO(@altanh): type and shape of return var
+        var = self.decl_var(var_name, None, None, union_span)
+        return relax.VarBinding(var, ite_expr, self.to_tvm_span(union_span))
 
-            # TODO(@altanh): perhaps this ought to be more general
+    def parse_return(self, stmt: ast.Return) -> relax.Expr:
+        """Parses the given synr return statement to the returned Relax expression.
 
-            if op == SpecialOp.DATAFLOW:
-                if len(call.params) > 0:
-                    self.report_error(
-                        "dataflow block constructor takes no arguments",
-                        call.params[0].span,
-                    )
-                if len(stmt.lhs) > 0:
-                    self.report_error(
-                        "dataflow blocks don't bind any patterns",
-                        stmt.lhs[0].span,
-                    )
-                return self.parse_dataflow(stmt.body)
-            else:
-                self.report_error("unsupported with block type", call.span)
+        Parameters
+        ----------
+        stmt : ast.Return
+            The input synr return statement
+
+        Returns
+        -------
+        relax.Expr
+            The parsed Relax expression being returned
+        """
+        return self.transform_expr(stmt.value)
 
-        elif isinstance(stmt, ast.Function):
-            func = self.transform_function(stmt)
-            func_var = self.decl_var(stmt.name, None, None, stmt.span)
-            return relax.VarBinding(func_var, func, self.to_tvm_span(stmt.span))
+    def parse_unassigned_call(self, stmt: ast.UnassignedCall) -> relax.MatchShape:
+        """Parses the given synr unassigned call to a Relax shape binding.
 
+        Parameters
+        ----------
+        stmt : ast.UnassignedCall
+            The input synr unassigned call
+
+        Returns
+        -------
+        relax.MatchShape
+            The parsed Relax shape binding
+        """
+        if self.transform_expr(stmt.call.func_name) == SpecialOp.MATCH_SHAPE:
+            return self.parse_shape_binding(stmt)
         else:
-            self.report_error(
-                "unsupported statement",
-                stmt.span,
-            )
+            self.report_error("the results of normal function calls must be bound", stmt.span)
+
+    def parse_with(self, stmt: ast.With) -> relax.DataflowBlock:
+        """Parses the given synr with block to a Relax dataflow block.
+
+        Parameters
+        ----------
+        stmt : ast.With
+            The input synr with statement
+
+        Returns
+        -------
+        relax.DataflowBlock
+            The parsed Relax dataflow block
+        """
+        if not isinstance(stmt.rhs, ast.Call):
+            self.report_error("unsupported with block", stmt.span)
+
+        call = stmt.rhs
+        op = self.transform_expr(call.func_name)
+
+        # TODO(@altanh): perhaps this ought to be more general
+
+        if op == SpecialOp.DATAFLOW:
+            if len(call.params) > 0:
+                self.report_error(
+                    "dataflow block constructor takes no arguments",
+                    call.params[0].span,
+                )
+            if len(stmt.lhs) > 0:
+                self.report_error(
+                    "dataflow blocks don't bind any patterns",
+                    stmt.lhs[0].span,
+                )
+            return self.parse_dataflow(stmt.body)
+        else:
+            self.report_error("unsupported with block type", call.span)
+
+    def parse_local_function(self, stmt: ast.Function) -> relax.VarBinding:
+        """Parses the given synr function definition to a binding of the local function.
+
+        Parameters
+        ----------
+        stmt : ast.Function
+            The input synr function definition
+
+        Returns
+        -------
+        relax.VarBinding
+            The parsed binding of the local function
+        """
+        func = self.transform_function(stmt)
+        func_var = self.decl_var(stmt.name, None, None, stmt.span)
+        return relax.VarBinding(func_var, func, self.to_tvm_span(stmt.span))
 
     def parse_dataflow(self, block: ast.Block) -> relax.DataflowBlock:
         """Parses the input synr block to a Relax dataflow block.
@@ -839,20 +952,40 @@ class RelaxTransformer(Transformer):
         relax.Expr
             The parsed expression.
         """
-        if expr.field.name == "shape":
+        if expr.field.name == _SHAPE_ATTR:
             obj = self.transform_expr(expr.object)
             return relay.Call(
-                relay.op.get("relax.shape_of"), [obj], span=self.to_tvm_span(expr.span)
+                self._resolve_op("relax.shape_of"), [obj], span=self.to_tvm_span(expr.span)
             )
         else:
             # assume it's a hierarchical op identifier (e.g. nn.softmax, relax.call_tir)
             op_name = self._parse_attrs_to_str(expr)
+            return self._resolve_op(op_name)
+
+    def _resolve_op(self, op_name: str) -> Union[SpecialOp, tvm.ir.Op]:
+        """Resolves the given operator name, memoizing the result so that repeated references
+        to the same operator don't repeatedly cross into the operator registry.
+
+        Parameters
+        ----------
+        op_name : str
+            The name of the operator (parser special operators included).
+
+        Returns
+        -------
+        Union[SpecialOp, tvm.ir.Op]
+            The resolved operator.
+        """
+        op = self._op_cache.get(op_name)
+        if op is None:
             # NOTE: at least for now, all special operators are namespaced
             try:
-                return SpecialOp(op_name)
+                op = SpecialOp(op_name)
             except ValueError:
                 # TODO(@altanh): maybe diagnostics here in case this fails?
-                return relay.op.get(op_name)
+                op = relay.op.get(op_name)
+            self._op_cache[op_name] = op
+        return op
 
     def parse_call(self, expr: ast.Call) -> Union[tir.PrimExpr, relax.Expr]:
         """Parses the given synr Call node to a Relax expression or PrimExpr.
@@ -869,6 +1002,8 @@ class RelaxTransformer(Transformer):
             PrimExprs.
         """
         op = self.transform_expr(expr.func_name)
+        # bound-method lookups hoisted out of the argument comprehensions below
+        transform_expr = self.transform_expr
 
         if op == SpecialOp.CALL_PACKED:
             extern_func = expr.params[0]
@@ -878,17 +1013,17 @@ class RelaxTransformer(Transformer):
                     extern_func.span,
                 )
             op = relax.ExternFunc(extern_func.value, self.to_tvm_span(extern_func.span))
-            args = [self.transform_expr(arg) for arg in expr.params[1:]]
+            args = [transform_expr(arg) for arg in expr.params[1:]]
 
         elif isinstance(op, ArithmeticOp):
-            args = [self.transform_expr(arg) for arg in expr.params]
+            args = [transform_expr(arg) for arg in expr.params]
             if all([isinstance(arg, tir.PrimExpr) for arg in args]):
                 return PRIMEXPR_ARITHMETIC_OP_MAP[op](*args, span=self.to_tvm_span(expr.span))
             # otherwise it's just a normal Relax operator call
-            op = RELAX_ARITHMETIC_OP_MAP[op]
+            op = _relax_arithmetic_op_map()[op]
 
         elif isinstance(op, tvm.ir.Op):
-            args = [self.transform_expr(arg) for arg in expr.params]
+            args = [transform_expr(arg) for arg in expr.params]
             # check call arity eagerly
             if op.name == "relax.call_tir":
                 # call_tir is special case because last argument is optional
@@ -905,7 +1040,7 @@ class RelaxTransformer(Transformer):
                 args[1] = relax.ExternFunc(args[1], self.to_tvm_span(expr.params[1].span))
 
         elif isinstance(op, relay.Expr):
-            args = [self.transform_expr(arg) for arg in expr.params]
+            args = [transform_expr(arg) for arg in expr.params]
 
         else:
             self.report_error(f"unsupported function in call: {op}", expr.func_name.span)
@@ -915,7 +1050,7 @@ class RelaxTransformer(Transformer):
         for key, val in expr.keyword_params.items():
             assert isinstance(key, ast.Constant) and isinstance(key.value, str)
             # TODO(@altanh): might need separate attribute parsing eventually
-            kwargs[key.value] = self.transform_expr(val)
+            kwargs[key.value] = transform_expr(val)
 
         is_default = False
         if "attrs_type_key" in kwargs:
@@ -955,61 +1090,105 @@ class RelaxTransformer(Transformer):
         relax.Expr
             The corresponding Relax expression
         """
-        if isinstance(expr, ast.Attr):
-            return self.parse_attr(expr)
+        parse = self._expr_dispatch.get(type(expr))
+        if parse is None:
+            self.report_error(f"unsupported expression: {expr}", expr.span)
+        return parse(expr)
 
-        elif isinstance(expr, ast.Call):
-            return self.parse_call(expr)
+    def parse_tuple(self, expr: ast.Tuple) -> Union[relax.ShapeExpr, relay.Tuple]:
+        """Parses the given synr Tuple node to a Relax tuple or shape expression.
+
+        Parameters
+        ----------
+        expr : ast.Tuple
+            The synr Tuple node to be parsed.
+
+        Returns
+        -------
+        Union[relax.ShapeExpr, relay.Tuple]
+            The parsed expression. It will be a ShapeExpr if all fields are PrimExprs.
+        """
+        fields = [self.transform_expr(field) for field in expr.values]
 
-        elif isinstance(expr, ast.Tuple):
-            fields = [self.transform_expr(field) for field in expr.values]
+        # TODO(@altanh): this check might be too weak; we really only accept integral PrimExprs
+        #                (e.g. int constants, dim vars, and integer operations on these)
 
-            # TODO(@altanh): this check might be too weak; we really only accept integral PrimExprs
-            #                (e.g. int constants, dim vars, and integer operations on these)
+        # coerce to ShapeExpr when fields are all PrimExprs
+        if all([isinstance(f, tir.PrimExpr) for f in fields]):
+            return relax.ShapeExpr(fields, span=self.to_tvm_span(expr.span))
+        return relay.Tuple(fields, span=self.to_tvm_span(expr.span))
 
-            # coerce to ShapeExpr when fields are all PrimExprs
-            if all([isinstance(f, tir.PrimExpr) for f in fields]):
-                return relax.ShapeExpr(fields, span=self.to_tvm_span(expr.span))
-            return relay.Tuple(fields, span=self.to_tvm_span(expr.span))
+    def parse_var(self, expr: ast.Var) -> relax.Expr:
+        """Parses the given synr Var node to the Relax expression it names.
 
-        elif isinstance(expr, ast.Var):
-            var_name = expr.id.name
-            if _is_registered(var_name, op_set=self._registered_ops):
-                return relay.op.get(var_name)
-            if var_name in self.scope:
-                return self.scope[var_name]
-            # NOTE: this is a "hack" to get around Python eagerly parsing class method decorators
-            #       first (meaning we need to resolve them after the functions are parsed). These
-            #       GlobalVars need to be resolved using string equality only.
-            return relay.GlobalVar(var_name)
+        Parameters
+        ----------
+        expr : ast.Var
+            The synr Var node to be parsed.
 
-        elif isinstance(expr, ast.Constant):
-            # FIXME(@altanh): use internal representation that doesn't have precision limits here
-            if isinstance(expr.value, int):
-                return tir.IntImm("int64", expr.value, self.to_tvm_span(expr.span))
-            elif isinstance(expr.value, float):
-                return tir.FloatImm("float32", expr.value, self.to_tvm_span(expr.span))
-            elif isinstance(expr.value, str):
-                # FIXME(@altanh): using StringImm seems to cause problems, but this loses span
-                return expr.value
-            elif expr.value is None:
-                return None
-            else:
-                self.report_error(
-                    f"unsupported constant expression: {expr}",
-                    expr.span,
-                )
+        Returns
+        -------
+        relax.Expr
+            The registered operator, in-scope variable, or global variable of the given name.
+        """
+        var_name = sys.intern(expr.id.name)
+        if _is_registered(var_name, op_set=self._registered_ops):
+            return self._resolve_op(var_name)
+        if var_name in self.scope:
+            return self.scope[var_name]
+        # NOTE: this is a "hack" to get around Python eagerly parsing class method decorators
+        #       first (meaning we need to resolve them after the functions are parsed). These
+        #       GlobalVars need to be resolved using string equality only.
+        return relay.GlobalVar(var_name)
+
+    def parse_constant(self, expr: ast.Constant) -> Union[tir.PrimExpr, str, None]:
+        """Parses the given synr Constant node to the corresponding TIR immediate.
 
-        elif isinstance(expr, ast.Op):
-            # TODO(@altanh): might need to generalize from ArithmeticOp if we decide to support
-            #                array slicing syntax
-            try:
-                return ArithmeticOp(expr.name)
-            except ValueError:
-                self.report_error(f"unsupported built-in operator: {expr.name}", expr.span)
+        Parameters
+        ----------
+        expr : ast.Constant
+            The synr Constant node to be parsed.
 
+        Returns
+        -------
+        Union[tir.PrimExpr, str, None]
+            The parsed constant.
+        """
+        # FIXME(@altanh): use internal representation that doesn't have precision limits here
+        if isinstance(expr.value, int):
+            return tir.IntImm("int64", expr.value, self.to_tvm_span(expr.span))
+        elif isinstance(expr.value, float):
+            return tir.FloatImm("float32", expr.value, self.to_tvm_span(expr.span))
+        elif isinstance(expr.value, str):
+            # FIXME(@altanh): using StringImm seems to cause problems, but this loses span
+            return expr.value
+        elif expr.value is None:
+            return None
         else:
-            self.report_error(f"unsupported expression: {expr}", expr.span)
+            self.report_error(
+                f"unsupported constant expression: {expr}",
+                expr.span,
+            )
+
+    def parse_op(self, expr: ast.Op) -> ArithmeticOp:
+        """Parses the given synr Op node to the corresponding arithmetic operator.
+
+        Parameters
+        ----------
+        expr : ast.Op
+            The synr Op node to be parsed.
+
+        Returns
+        -------
+        ArithmeticOp
+            The parsed operator.
+        """
+        # TODO(@altanh): might need to generalize from ArithmeticOp if we decide to support
+        #                array slicing syntax
+        try:
+            return ArithmeticOp(expr.name)
+        except ValueError:
+            self.report_error(f"unsupported built-in operator: {expr.name}", expr.span)
 
     def transform_block(self, block: ast.Block) -> relax.SeqExpr:
         """Transforms the given synr block to a Relax SeqExpr (sequence of Blocks with a final
@@ -1025,20 +1204,31 @@ class RelaxTransformer(Transformer):
         relax.SeqExpr
             The parsed SeqExpr
         """
+        # fast path: a return-only block (common for rewritten if-else branches) has no
+        # bindings to collect, so skip the block-building machinery entirely
+        if len(block.stmts) == 1 and isinstance(block.stmts[0], ast.Return):
+            ret_expr = self.transform_stmt(block.stmts[0])
+            return relax.SeqExpr([], ret_expr, self.to_tvm_span(block.span))
+
         # a block of statements needs to be converted to a SeqExpr of binding blocks
         blocks = []
         current_block = []
+        # hoisted out of the per-binding loop; transform_stmt dominates the loop body
+        transform_stmt = self.transform_stmt
+        append_binding = current_block.append
         for stmt in block.stmts[:-1]:
-            parsed_stmt = self.transform_stmt(stmt)
+            parsed_stmt = transform_stmt(stmt)
             if isinstance(parsed_stmt, relax.DataflowBlock):
                 if current_block:
                     # FIXME(@altanh): need to manually construct span start & end
                     blocks.append(relax.BindingBlock(current_block, self.to_tvm_span(stmt.span)))
-                    current_block = []
+                    # BindingBlock copies its bindings into a TVM array, so the
+                    # Python-side list can be pooled across binding blocks
+                    current_block.clear()
                 blocks.append(parsed_stmt)
             else:
                 assert isinstance(parsed_stmt, relax.Binding)
-                current_block.append(parsed_stmt)
+                append_binding(parsed_stmt)
         if len(current_block) > 0:
             blocks.append(relax.BindingBlock(current_block, self.to_tvm_span(stmt.span)))
 
@@ -1053,15 +1243,30 @@ class RelaxTransformer(Transformer):
         return relax.SeqExpr(blocks, ret_expr, self.to_tvm_span(block.span))
 
 
+_DIAGNOSTIC_LEVEL_MAP = {
+    "error": diagnostics.DiagnosticLevel.ERROR,
+    "bug": diagnostics.DiagnosticLevel.BUG,
+    "warning": diagnostics.DiagnosticLevel.WARNING,
+}
+
+
 class RelaxDiagnosticContext(synr.DiagnosticContext):
     def __init__(self, ir_mod):
         self.tvm_diag_ctx = diagnostics.DiagnosticContext(ir_mod, diagnostics.get_renderer())
         self.str_to_source_name = {}
+        # one-entry memo for to_tvm_span: spans are converted once per AST node and
+        # virtually always come from the same file as the previous one
+        self._last_filename = None
+        self._last_source_name = None
         self._render_on_error = False
 
     def to_tvm_span(self, ast_span: ast.Span) -> tvm.ir.Span:
+        filename = ast_span.filename
+        if filename != self._last_filename:
+            self._last_source_name = self.str_to_source_name[filename]
+            self._last_filename = filename
         return tvm.ir.Span(
-            self.str_to_source_name[ast_span.filename],
+            self._last_source_name,
             ast_span.start_line,
             ast_span.end_line,
             ast_span.start_column,
@@ -1075,20 +1280,14 @@ class RelaxDiagnosticContext(synr.DiagnosticContext):
         """
         src_name = self.tvm_diag_ctx.module.source_map.add(name, source)
         self.str_to_source_name[name] = src_name
+        self._last_filename = None  # invalidate the to_tvm_span memo
 
     def emit(self, level: str, message: str, span: tvm.ir.Span) -> None:
         """Called when an error has occured."""
         if isinstance(span, ast.Span):
             span = self.to_tvm_span(span)
 
-        if level == "error":
-            level = diagnostics.DiagnosticLevel.ERROR
-        elif level == "bug":
-            level = diagnostics.DiagnosticLevel.BUG
-        elif level == "warning":
-            level = diagnostics.DiagnosticLevel.WARNING
-        else:
-            level = "error"
+        level = _DIAGNOSTIC_LEVEL_MAP.get(level, diagnostics.DiagnosticLevel.ERROR)
 
         assert span, "Span must not be null"
         assert isinstance(span, tvm.ir.Span), "Expected tvm.ir.Span, but got " + str(type(span))